@@ -6,11 +6,16 @@ from __future__ import annotations
 import argparse
 import datetime as dt
 import ipaddress
+import json
 import os
 import re
 import sys
-from collections import defaultdict
-from typing import Dict, Iterable, List, Optional, Tuple
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from operator import attrgetter, itemgetter
+from types import SimpleNamespace
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 
 try:
     import openstack
@@ -28,6 +33,10 @@ except Exception:
 
 # ------------------------------- ANSI colors ---------------------------------
 
+STATUS_GOOD = frozenset({"ACTIVE", "UP", "ENABLED", "AVAILABLE", "RUNNING", "ONLINE"})
+STATUS_WARN = frozenset({"DOWN", "BUILD", "SHUTOFF", "PAUSED", "SUSPENDED", "DELETING", "RESIZING", "QUEUED"})
+STATUS_BAD = frozenset({"ERROR", "CRASHED", "DEGRADED", "FAILED", "OFFLINE"})
+
 class Palette:
     def __init__(self, enabled: bool):
         self.enabled = enabled and sys.stdout.isatty() and not os.environ.get("NO_COLOR")
@@ -45,19 +54,16 @@ class Palette:
         self.MAGENTA = c("\033[35m")
         self.GRAY = c("\033[90m")
 
+        # STATUS -> color code, so colorizing is a single lookup
+        self._status_color: Dict[str, str] = {}
+        for bucket, code in ((STATUS_GOOD, self.GREEN), (STATUS_WARN, self.YELLOW), (STATUS_BAD, self.RED)):
+            self._status_color.update(dict.fromkeys(bucket, code))
+
     def colorize_status(self, s: str) -> str:
-        key = (s or "").strip().upper()
-        good = {"ACTIVE", "UP", "ENABLED", "AVAILABLE", "RUNNING", "ONLINE"}
-        warn = {"DOWN", "BUILD", "SHUTOFF", "PAUSED", "SUSPENDED", "DELETING", "RESIZING", "QUEUED"}
-        bad = {"ERROR", "CRASHED", "DEGRADED", "FAILED", "OFFLINE"}
-
-        if key in good:
-            return f"{self.GREEN}{s}{self.RESET}"
-        if key in warn:
-            return f"{self.YELLOW}{s}{self.RESET}"
-        if key in bad:
-            return f"{self.RED}{s}{self.RESET}"
-        return s
+        if not self.enabled:
+            return s
+        color = self._status_color.get((s or "").strip().upper())
+        return f"{color}{s}{self.RESET}" if color else s
 
 ANSI_RE = re.compile(r"\x1b\[[0-9;]*m")
 def strip_ansi(s: str) -> str:
@@ -68,39 +74,52 @@ def limit_str(v: Optional[int]) -> str:
         return "∞"
     return str(v)
 
+def visible_len(s: str) -> int:
+    # Most lines carry no escapes at all (--no-color, redirected output)
+    return len(strip_ansi(s)) if "\x1b" in s else len(s)
+
 def wrap_bullet_line(text: str, max_width: int, indent: int = 2) -> str:
     if max_width <= 0:
         return text
+    measure = visible_len if "\x1b" in text else len
     segs = text.split(" • ")
     lines: List[str] = []
     cur = ""
+    cur_len = 0  # visible length of cur, kept incrementally
     for seg in segs:
-        candidate = seg if not cur else f"{cur} • {seg}"
-        if len(strip_ansi(candidate)) <= max_width:
-            cur = candidate
+        seg_len = measure(seg)
+        cand_len = seg_len if not cur else cur_len + 3 + seg_len
+        if cand_len <= max_width:
+            cur = seg if not cur else f"{cur} • {seg}"
+            cur_len = cand_len
             continue
         if cur:
             lines.append(cur)
         parts = seg.split(", ")
         cur2 = ""
+        cur2_len = 0
         for part in parts:
-            cand2 = part if not cur2 else f"{cur2}, {part}"
-            if len(strip_ansi(cand2)) <= max_width - indent:
-                cur2 = cand2
+            part_len = measure(part)
+            cand2_len = part_len if not cur2 else cur2_len + 2 + part_len
+            if cand2_len <= max_width - indent:
+                cur2 = part if not cur2 else f"{cur2}, {part}"
+                cur2_len = cand2_len
             else:
                 if cur2:
                     lines.append(" " * indent + cur2)
                 cur2 = part
+                cur2_len = part_len
         if cur2:
             lines.append(" " * indent + cur2)
         cur = ""
+        cur_len = 0
     if cur:
         lines.append(cur)
     return "\n".join(lines)
 
 POWER_STATE_MAP = {0: "NOSTATE", 1: "RUNNING", 3: "PAUSED", 4: "SHUTDOWN", 6: "CRASHED", 7: "SUSPENDED", 8: "UNKNOWN"}
 ROUTER_IF_OWNERS = ("network:router_interface","network:router_interface_distributed","network:ha_router_replicated_interface")
-EXCLUDE_FREE_STANDING_PREFIXES = ("compute:","network:","octavia:","trunk:")
+SERVER_FIELDS = ("name","status","vm_state","compute_host","power_state","image","flavor","key_name")
 
 def boolstr(v: Optional[bool]) -> str:
     return "on" if v else "off"
@@ -108,6 +127,14 @@ def boolstr(v: Optional[bool]) -> str:
 def gw_suffix(gw: Optional[str]) -> str:
     if not gw:
         return "-"
+    if ":" not in gw:
+        # Dotted-quad fast path (0-255, no leading zeros); IPv6 and anything
+        # malformed go through the full ipaddress parser
+        octets = gw.split(".")
+        if len(octets) == 4 and all(
+            o.isascii() and o.isdigit() and int(o) <= 255 and (o == "0" or o[0] != "0") for o in octets
+        ):
+            return "." + octets[-1]
     try:
         ip = ipaddress.ip_address(gw)
         if ip.version == 4:
@@ -132,20 +159,83 @@ def parse_backend_from_host(host: Optional[str]) -> str:
     except Exception:
         return "-"
 
+_get_name = attrgetter("name")
+
 def sort_by_name(items: Iterable) -> List:
-    return sorted(items, key=lambda o: (getattr(o, "name", "") or "").lower())
+    # Decorate-sort-undecorate: each name is fetched and lowercased exactly once.
+    # Names are read with the C-level attrgetter; getattr only if some item has none.
+    items = list(items)
+    try:
+        names = list(map(_get_name, items))
+    except AttributeError:
+        names = [getattr(o, "name", "") for o in items]
+    keyed = [((n or "").lower(), o) for n, o in zip(names, items)]
+    keyed.sort(key=itemgetter(0))
+    return [o for _, o in keyed]
+
+def prefetch(jobs: Dict[str, Callable[[], object]], max_workers: int = 16) -> Dict[str, Future]:
+    """
+    Run independent API calls concurrently and return their futures keyed by name.
+    Callers collect each result with .result() when the section needing it renders;
+    exceptions are re-raised there, so per-section fallbacks keep working.
+    """
+    pool = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        return {name: pool.submit(fn) for name, fn in jobs.items()}
+    finally:
+        pool.shutdown(wait=False)
 
-def compute_usage(conn, project_id, servers, flavor_by_id):
+# ------------------------------ metadata cache -------------------------------
+
+# Slow-changing catalogs that may be reused across runs (see --cache-ttl)
+CACHED_KINDS = ("flavors", "images")
+CACHE_DIR = os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "project-overview")
+
+def cache_path(conn, project_id: Optional[str]) -> str:
+    cloud = getattr(getattr(conn, "config", None), "name", None) or "default"
+    fname = re.sub(r"[^A-Za-z0-9_.-]", "_", f"{cloud}-{project_id}")
+    return os.path.join(CACHE_DIR, f"{fname}.json")
+
+def load_cache(path: str, ttl: int) -> Dict[str, List[SimpleNamespace]]:
+    """
+    Return the cached catalogs if the cache file is younger than ttl seconds.
+    Entries come back as plain namespaces, which is all the renderers need.
+    Any problem (missing, stale, corrupt, partial) is treated as a miss.
+    """
+    if ttl <= 0:
+        return {}
+    try:
+        if time.time() - os.path.getmtime(path) > ttl:
+            return {}
+        with open(path, encoding="utf-8") as fh:
+            data = json.load(fh)
+        return {kind: [SimpleNamespace(**d) for d in data[kind]] for kind in CACHED_KINDS}
+    except Exception:
+        return {}
+
+def save_cache(path: str, catalogs: Dict[str, List]) -> None:
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        data = {kind: [o.to_dict() for o in items] for kind, items in catalogs.items()}
+        tmp = f"{path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump(data, fh, default=str)
+        os.replace(tmp, path)
+    except Exception:
+        pass  # the cache is best-effort only
+
+def compute_usage(conn, project_id, live_servers, flavor_by_id, limits: Optional[Future] = None):
     """
     Return (instances_used, cores_used, ram_used_mb) as robustly as possible.
     Order of preference:
-      1) Nova absolute limits (total*Used)
+      1) Nova absolute limits (total*Used); `limits` is the caller's prefetch future, if any,
+         and a failed prefetch is not retried
       2) Quota set with usage/detail (cores_in_use/ram_in_use/instances_in_use or nested dicts)
-      3) Sum from servers, using embedded flavor numbers or flavor lookup
+      3) Sum from live (non-deleted) servers, using embedded flavor numbers or the flavor list
     """
     # 1) Nova absolute limits
     try:
-        limits = conn.compute.get_limits()
+        limits = conn.compute.get_limits() if limits is None else limits.result()
         abs_lim = getattr(limits, "absolute", limits)
         def getv(k):
             return (getattr(abs_lim, k, None) if hasattr(abs_lim, k)
@@ -190,12 +280,11 @@ def compute_usage(conn, project_id, servers, flavor_by_id):
     except Exception:
         pass
 
-    # 3) Fallback: sum from servers
-    live = [s for s in servers if (getattr(s, "status", "") or "").upper() not in ("DELETED", "SOFT_DELETED")]
-    iu = len(live)
+    # 3) Fallback: sum from servers (already filtered by the caller)
+    iu = len(live_servers)
     cu = 0
     ru = 0
-    for s in live:
+    for s in live_servers:
         vcpus = None
         ram_mb = None
         # Prefer embedded numbers (present with many microversions)
@@ -213,14 +302,14 @@ def compute_usage(conn, project_id, servers, flavor_by_id):
             except Exception:
                 fid = None
             if fid:
-                fobj = flavor_by_id.get(fid)
-                if not fobj:
+                if fid not in flavor_by_id:
+                    # Deleted or no-longer-visible flavors are not in the list but still
+                    # GET-able; one GET per distinct id, failures cached as None too
                     try:
-                        fobj = conn.compute.get_flavor(fid)
-                        if fobj:
-                            flavor_by_id[fobj.id] = fobj
+                        flavor_by_id[fid] = conn.compute.get_flavor(fid)
                     except Exception:
-                        fobj = None
+                        flavor_by_id[fid] = None
+                fobj = flavor_by_id[fid]
                 if fobj:
                     if vcpus is None:
                         vcpus = getattr(fobj, "vcpus", 0)
@@ -237,8 +326,14 @@ def main():
     parser = argparse.ArgumentParser(description="Compact OpenStack project overview")
     parser.add_argument("--no-color", action="store_true", help="Disable ANSI colors")
     parser.add_argument("--max-width", type=int, default=120, help="Wrap lines to this width (0 disables wrapping)")
+    parser.add_argument("--cache-ttl", type=int, default=0, metavar="SECONDS",
+                        help="Reuse flavors/images cached on disk by a previous run within SECONDS (0 disables)")
+    parser.add_argument("--deep", action="store_true",
+                        help="Query role assignments when the token carries no role names (extra API calls)")
     args = parser.parse_args()
     pal = Palette(enabled=not args.no_color)
+    # Rendered lines are collected here and written to stdout in one go at the end
+    out: List[str] = []
 
     try:
         conn = openstack.connect()
@@ -249,6 +344,51 @@ def main():
     project_id = getattr(conn, "current_project_id", None)
     user_id = getattr(conn, "current_user_id", None)
 
+    # Fire off every independent list/quota call up front; the wall time is
+    # dominated by HTTP round-trips, so overlapping them beats fetching serially.
+    def list_fips():
+        try:
+            return list(conn.network.ips(project_id=project_id))
+        except Exception:
+            return list(conn.network.floating_ips(project_id=project_id))
+
+    def group_rules() -> Dict[Tuple[str, str], List[object]]:
+        # Rules are only ever looked up by (group, direction); index them while
+        # the pages stream in instead of materializing the whole list first.
+        # They are owned by their group's project, so let Neutron do the filtering.
+        grouped: Dict[Tuple[str, str], List[object]] = defaultdict(list)
+        for r in conn.network.security_group_rules(project_id=project_id):
+            grouped[(getattr(r, "security_group_id", None), getattr(r, "direction", "ingress"))].append(r)
+        return grouped
+
+    cache_file = cache_path(conn, project_id)
+    cached = load_cache(cache_file, args.cache_ttl)
+
+    # The large, multi-page collections go first so their transfer overlaps the rest
+    jobs: Dict[str, Callable[[], object]] = {
+        "ports": lambda: list(conn.network.ports(project_id=project_id)),
+        "servers": lambda: list(conn.compute.servers(details=True)),
+        "volumes": lambda: list(conn.block_storage.volumes(details=True)),
+        "security_group_rules": group_rules,
+        "networks": lambda: list(conn.network.networks()),
+        "subnets": lambda: list(conn.network.subnets()),
+        "routers": lambda: list(conn.network.routers(project_id=project_id)),
+        "security_groups": lambda: list(conn.network.security_groups(project_id=project_id)),
+        "fips": list_fips,
+        "network_quota": lambda: conn.network.get_quota(project_id),
+        "flavors": lambda: list(conn.compute.flavors()),
+        "images": lambda: list(conn.image.images()),
+        "keypairs": lambda: list(conn.compute.keypairs()),
+        "compute_quota": lambda: conn.compute.get_quota_set(project_id),
+        "limits": lambda: conn.compute.get_limits(),
+        "snapshots": lambda: list(conn.block_storage.snapshots(details=True)),
+        "backups": lambda: list(conn.block_storage.backups(details=True)),
+        "volume_quota": lambda: conn.block_storage.get_quota_set(project_id),
+    }
+    for kind, items in cached.items():
+        jobs[kind] = lambda items=items: items
+    fetched = prefetch(jobs)
+
     project = conn.identity.get_project(project_id) if project_id else None
     user = conn.identity.get_user(user_id) if user_id else None
 
@@ -269,7 +409,9 @@ def main():
             roles = getattr(auth_ref, "roles", []) or []
             role_names = [r.get("name") for r in roles if isinstance(r, dict) and r.get("name")]
     except Exception:
-        # Fallback to role assignments (may require elevated policy)
+        pass
+    if not role_names and args.deep:
+        # Fallback to role assignments (two more calls; may require elevated policy)
         try:
             assignments = list(conn.identity.role_assignments(user=user_id, project=project_id))
             role_ids = [a.role["id"] for a in assignments if getattr(a, "role", None)]
@@ -278,48 +420,52 @@ def main():
         except Exception:
             role_names = []
 
+    domain_name = domain.name if domain is not None else "Unknown"
+    project_name = project.name if project is not None else "Unknown"
+    user_name = user.name if user is not None else "Unknown"
     now = dt.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    print(
+    # The header goes out right away, while the prefetched calls are still in flight
+    sys.stdout.write(
         f"{pal.BOLD}OpenStack Project Overview{pal.RESET}  "
-        f"({pal.CYAN}Epoxy 2025.1{pal.RESET})  [{now}]"
-    )
-    print(
-        f"Identity: domain={getattr(domain, 'name', 'Unknown')} • "
-        f"project={getattr(project, 'name', 'Unknown')} • "
-        f"user={getattr(user, 'name', 'Unknown')} • "
-        f"roles={', '.join(role_names) if role_names else '-'}"
+        f"({pal.CYAN}Epoxy 2025.1{pal.RESET})  [{now}]\n"
+        f"Identity: domain={domain_name} • project={project_name} • user={user_name} • "
+        f"roles={', '.join(role_names) if role_names else '-'}\n"
+        "\n"
     )
-    print()
+    sys.stdout.flush()
 
     # ----------------------------- Networking -----------------------------
     try:
-        all_networks = list(conn.network.networks())  # visible to project
-        all_subnets = list(conn.network.subnets())
+        all_networks = fetched["networks"].result()  # visible to project
+        all_subnets = fetched["subnets"].result()
     except Exception:
         all_networks, all_subnets = [], []
 
     networks_by_id: Dict[str, object] = {n.id: n for n in all_networks}
     subnets_by_id: Dict[str, object] = {s.id: s for s in all_subnets}
+    # subnet id -> (network name, subnet name), resolved once for every port loop
+    # (router interfaces, free-standing ports, instance ports)
+    subnet_names_by_id: Dict[str, Tuple[str, str]] = {}
+    for s in all_subnets:
+        net = networks_by_id.get(getattr(s, "network_id", None))
+        subnet_names_by_id[s.id] = (getattr(net, "name", "-"), getattr(s, "name", "-"))
 
     try:
-        project_ports = list(conn.network.ports(project_id=project_id))
+        project_ports = fetched["ports"].result()
     except Exception:
         project_ports = []
     try:
-        project_routers = list(conn.network.routers(project_id=project_id))
+        project_routers = fetched["routers"].result()
     except Exception:
         project_routers = []
     try:
-        project_sgs = list(conn.network.security_groups(project_id=project_id))
+        project_sgs = fetched["security_groups"].result()
     except Exception:
         project_sgs = []
     try:
-        project_fips = list(conn.network.ips(project_id=project_id))
+        project_fips = fetched["fips"].result()
     except Exception:
-        try:
-            project_fips = list(conn.network.floating_ips(project_id=project_id))
-        except Exception:
-            project_fips = []
+        project_fips = []
 
     def is_external(n) -> bool:
         return bool(getattr(n, "is_router_external", getattr(n, "router_external", False)))
@@ -341,7 +487,7 @@ def main():
             return None
 
     try:
-        neutron_quota = conn.network.get_quota(project_id)
+        neutron_quota = fetched["network_quota"].result()
     except Exception:
         neutron_quota = None
 
@@ -359,7 +505,7 @@ def main():
     sgs_lim  = nq(neutron_quota, "security_group", "security_groups")
     fips_lim = nq(neutron_quota, "floatingip", "floating_ips")
 
-    print(
+    out.append(
         f"{pal.BOLD}NEUTRON — Networking{pal.RESET}  "
         f"(networks {nets_used}/{limit_str(nets_lim)} • "
         f"subnets {subs_used}/{limit_str(subs_lim)} • "
@@ -369,20 +515,27 @@ def main():
         f"fips {fips_used}/{limit_str(fips_lim)})"
     )
 
-    def format_net_line(n) -> str:
-        status = pal.colorize_status((getattr(n, "status", None) or "").upper() or "-")
-        admin  = pal.colorize_status("UP" if getattr(n, "is_admin_state_up", getattr(n, "admin_state_up", False)) else "DOWN")
-        sids = getattr(n, "subnet_ids", []) or []
-        subs = [subnets_by_id.get(sid) for sid in sids if sid in subnets_by_id]
-        subbits: List[str] = []
-        for s in sort_by_name(subs):
+    # Subnet summaries are built on first use and reused by every network listing them
+    subnet_text: Dict[str, str] = {}
+
+    def format_subnet(s) -> str:
+        text = subnet_text.get(s.id)
+        if text is None:
             pools = getattr(s, "allocation_pools", None) or []
             pools_s = ";".join([f"{p.get('start')}-{p.get('end')}" for p in pools]) or "-"
             dhcp = "on" if getattr(s, "is_dhcp_enabled", getattr(s, "enable_dhcp", False)) else "off"
             gw = gw_suffix(getattr(s, "gateway_ip", None))
-            subbits.append(f"{getattr(s, 'name', s.id if s else '-')}"
-                           f" {getattr(s, 'cidr', '-')}"
-                           f" gw:{gw} dhcp:{dhcp} pools:{pools_s}")
+            text = subnet_text[s.id] = (f"{getattr(s, 'name', s.id)}"
+                                        f" {getattr(s, 'cidr', '-')}"
+                                        f" gw:{gw} dhcp:{dhcp} pools:{pools_s}")
+        return text
+
+    def format_net_line(n) -> str:
+        status = pal.colorize_status((getattr(n, "status", None) or "").upper() or "-")
+        admin  = pal.colorize_status("UP" if getattr(n, "is_admin_state_up", getattr(n, "admin_state_up", False)) else "DOWN")
+        sids = getattr(n, "subnet_ids", []) or []
+        subs = [subnets_by_id[sid] for sid in sids if sid in subnets_by_id]
+        subbits = [format_subnet(s) for s in sort_by_name(subs)]
         subs_text = " | ".join(subbits) if subbits else "-"
         return f"  ▸ {getattr(n, 'name', n.id)}        [{status}|{admin}]   subnets: {subs_text}"
 
@@ -391,26 +544,36 @@ def main():
     internal_nets = sort_by_name(internal_nets)
 
     if provider_nets:
-        print("Provider networks:")
+        out.append("Provider networks:")
         for n in provider_nets:
-            print(wrap_bullet_line(format_net_line(n), args.max_width))
+            out.append(wrap_bullet_line(format_net_line(n), args.max_width))
     if external_nets:
-        print("External networks:")
+        out.append("External networks:")
         for n in external_nets:
-            print(wrap_bullet_line(format_net_line(n), args.max_width))
+            out.append(wrap_bullet_line(format_net_line(n), args.max_width))
     if internal_nets:
-        print("Internal networks:")
+        out.append("Internal networks:")
         for n in internal_nets:
-            print(wrap_bullet_line(format_net_line(n), args.max_width))
+            out.append(wrap_bullet_line(format_net_line(n), args.max_width))
 
-    print()
-    print(f"Routers ({rtr_used}/{limit_str(rtr_lim)}):")
+    out.append("")
+    out.append(f"Routers ({rtr_used}/{limit_str(rtr_lim)}):")
 
+    # Classify every port in one pass: unowned -> free-standing, router
+    # interfaces -> their router, anything else with a device -> that server.
     ports_by_router: Dict[str, List] = defaultdict(list)
+    ports_by_server: Dict[str, List] = defaultdict(list)
+    free_ports: List[object] = []
     for p in project_ports:
-        if getattr(p, "device_id", None) and getattr(p, "device_owner", ""):
-            if any(p.device_owner.startswith(prefix) for prefix in ROUTER_IF_OWNERS):
-                ports_by_router[p.device_id].append(p)
+        owner = (getattr(p, "device_owner", "") or "").strip()
+        device_id = getattr(p, "device_id", None)
+        if not owner:
+            free_ports.append(p)
+        elif device_id and owner.startswith(ROUTER_IF_OWNERS):
+            ports_by_router[device_id].append(p)
+            continue
+        if device_id:
+            ports_by_server[device_id].append(p)
 
     for r in sort_by_name(project_routers):
         status = pal.colorize_status((getattr(r, "status", None) or "").upper() or "-")
@@ -420,54 +583,33 @@ def main():
         interfaces = []
         for p in ports_by_router.get(r.id, []):
             for f in getattr(p, "fixed_ips", []) or []:
-                sid = f.get("subnet_id")
-                s = subnets_by_id.get(sid)
-                if not s:
-                    continue
-                net = networks_by_id.get(getattr(s, "network_id", None))
-                netname = getattr(net, "name", net.id if net else "-")
-                interfaces.append(f"{netname}/{getattr(s, 'name', s.id if s else '-')}")
+                names = subnet_names_by_id.get(f.get("subnet_id"))
+                if names:
+                    interfaces.append("/".join(names))
         ifs_text = ", ".join(sorted(interfaces)) if interfaces else "-"
-        print(wrap_bullet_line(f"  ▸ {getattr(r, 'name', r.id)}            [{status}]  ext: {ext_net_name}  ifs:[{ifs_text}]",
+        out.append(wrap_bullet_line(f"  ▸ {getattr(r, 'name', r.id)}            [{status}]  ext: {ext_net_name}  ifs:[{ifs_text}]",
                                args.max_width))
 
-    print()
-    free_ports: List[object] = []
-    for p in project_ports:
-        owner = (getattr(p, "device_owner", "") or "").strip()
-        if owner and any(owner.startswith(prefix) for prefix in EXCLUDE_FREE_STANDING_PREFIXES):
-            continue
-        if owner:
-            continue
-        free_ports.append(p)
-
-    print(f"Free-standing ports ({len(free_ports)}):")
+    out.append("")
+    out.append(f"Free-standing ports ({len(free_ports)}):")
     for p in sort_by_name(free_ports):
         status = pal.colorize_status((getattr(p, "status", None) or "").upper() or "-")
         name = getattr(p, "name", "") or "<no-name>"
         pieces = []
         for f in getattr(p, "fixed_ips", []) or []:
-            sid = f.get("subnet_id"); ip = f.get("ip_address")
-            s = subnets_by_id.get(sid)
-            net = networks_by_id.get(getattr(s, "network_id", None)) if s else None
-            pieces.append(f"{getattr(net,'name','-')}/{getattr(s,'name','-')} {ip}")
+            netname, subname = subnet_names_by_id.get(f.get("subnet_id"), ("-", "-"))
+            pieces.append(f"{netname}/{subname} {f.get('ip_address')}")
         piece = "; ".join(pieces) if pieces else "-"
-        print(wrap_bullet_line(f"  ▸ {name:<18} [{status}]  {piece}", args.max_width))
+        out.append(wrap_bullet_line(f"  ▸ {name:<18} [{status}]  {piece}", args.max_width))
 
-    print()
-    print(f"Security groups ({sgs_used}/{limit_str(sgs_lim)}):")
+    out.append("")
+    out.append(f"Security groups ({sgs_used}/{limit_str(sgs_lim)}):")
 
     sg_name_by_id = {sg.id: sg.name for sg in project_sgs}
-    sg_rules_by_sg_and_dir: Dict[Tuple[str, str], List[object]] = defaultdict(list)
     try:
-        all_rules = list(conn.network.security_group_rules())
-        for r in all_rules:
-            sg_id = getattr(r, "security_group_id", None)
-            if sg_id in sg_name_by_id:
-                direction = getattr(r, "direction", "ingress")
-                sg_rules_by_sg_and_dir[(sg_id, direction)].append(r)
+        sg_rules_by_sg_and_dir: Dict[Tuple[str, str], List[object]] = fetched["security_group_rules"].result()
     except Exception:
-        pass
+        sg_rules_by_sg_and_dir = {}
 
     def compact_rules(rules: List[object]) -> str:
         groups: Dict[Tuple[str, str, str], List[str]] = defaultdict(list)
@@ -497,10 +639,7 @@ def main():
             groups[key].append(token)
         parts: List[str] = []
         for (proto, remote, eth), tokens in groups.items():
-            uniq = []
-            for t in tokens:
-                if t not in uniq:
-                    uniq.append(t)
+            uniq = list(dict.fromkeys(tokens))  # order-preserving dedup
             port_repr = ",".join(uniq) if uniq else "any"
             if proto in ("any",):
                 seg = f"any to {remote} {eth}"
@@ -514,11 +653,11 @@ def main():
     for sg in sort_by_name(project_sgs):
         ingress = compact_rules(sg_rules_by_sg_and_dir.get((sg.id, "ingress"), []))
         egress  = compact_rules(sg_rules_by_sg_and_dir.get((sg.id, "egress"), []))
-        print(wrap_bullet_line(f"  ▸ {sg.name}  (ingress: {ingress} | egress: {egress})", args.max_width))
+        out.append(wrap_bullet_line(f"  ▸ {sg.name}  (ingress: {ingress} | egress: {egress})", args.max_width))
 
-    print()
+    out.append("")
     free_fips = [f for f in project_fips if not getattr(f, "port_id", None)]
-    print(f"Free-standing Floating IPs ({len(free_fips)}/{limit_str(fips_lim)}):")
+    out.append(f"Free-standing Floating IPs ({len(free_fips)}/{limit_str(fips_lim)}):")
     for f in sort_by_name(free_fips):
         status = pal.colorize_status((getattr(f, "status", None) or "").upper() or "-")
         net_name = "-"
@@ -527,46 +666,52 @@ def main():
             net_name = getattr(extn, "name", "-")
         except Exception:
             pass
-        print(wrap_bullet_line(
+        out.append(wrap_bullet_line(
             f"  ▸ {getattr(f, 'floating_ip_address', '-'):<15}  ext-net: {net_name}  [{status}]  (not associated)",
             args.max_width))
 
     # ------------------------------- Compute -------------------------------
-    print()
+    out.append("")
 
     try:
-        flavors = list(conn.compute.flavors())
+        flavors = fetched["flavors"].result()
     except Exception:
         flavors = []
     try:
-        images = list(conn.image.images())
+        images = fetched["images"].result()
     except Exception:
         images = []
     try:
-        keypairs = list(conn.compute.keypairs())
+        keypairs = fetched["keypairs"].result()
     except Exception:
         keypairs = []
     try:
-        servers = list(conn.compute.servers(details=True))
+        servers = fetched["servers"].result()
     except Exception:
         servers = []
 
+    if args.cache_ttl > 0 and not cached and all(fetched[k].exception() is None for k in CACHED_KINDS):
+        save_cache(cache_file, {"flavors": flavors, "images": images})
+
     flavor_by_id = {f.id: f for f in flavors}
     image_name_by_id = {i.id: i.name for i in images}
     live_servers = [s for s in servers if (getattr(s, "status", "") or "").upper() not in ("DELETED", "SOFT_DELETED")]
 
+    # Kept as a future: .result() re-raises a failed prefetch without calling the API again
+    limits = fetched["limits"]
+
     # --- Compute quotas (max) from quota set ---
     max_instances = max_cores = max_ram_mb = None
     try:
-        qset = conn.compute.get_quota_set(project_id)
+        qset = fetched["compute_quota"].result()
         max_instances = getattr(qset, "instances", None)
         max_cores     = getattr(qset, "cores", None)
         max_ram_mb    = getattr(qset, "ram", None)  # MB
     except Exception:
         # Fallback: limits maxima
         try:
-            limits = conn.compute.get_limits()
-            abs_lim = getattr(limits, "absolute", limits)
+            lim = limits.result()
+            abs_lim = getattr(lim, "absolute", lim)
             def getv(k):
                 return (getattr(abs_lim, k, None) if hasattr(abs_lim, k)
                         else abs_lim.get(k, None) if hasattr(abs_lim, "get") else None)
@@ -577,7 +722,7 @@ def main():
             pass
 
     # --- Compute usage (used instances, cores, ram) robustly ---
-    used_instances, used_vcpus, used_ram_mb = compute_usage(conn, project_id, servers, flavor_by_id)
+    used_instances, used_vcpus, used_ram_mb = compute_usage(conn, project_id, live_servers, flavor_by_id, limits)
 
     compute_header = (
         f"{pal.BOLD}NOVA — Compute{pal.RESET}  "
@@ -585,20 +730,20 @@ def main():
         f"vcpus {used_vcpus}/{limit_str(max_cores)} • "
         f"ram {used_ram_mb}/{limit_str(max_ram_mb)} MB)"
     )
-    print(compute_header)
+    out.append(compute_header)
 
 
     if flavors:
-        print(f"Flavors ({len(flavors)} visible):")
+        out.append(f"Flavors ({len(flavors)} visible):")
         for f in sort_by_name(flavors):
             ephem = getattr(f, "ephemeral", getattr(f, "OS-FLV-EXT-DATA:ephemeral", 0)) or 0
             pub = "public" if getattr(f, "is_public", True) else "private"
-            print(wrap_bullet_line(
+            out.append(wrap_bullet_line(
                 f"  ▸ {f.name:<12} vCPU={getattr(f,'vcpus',0)} RAM={getattr(f,'ram',0)} Disk={getattr(f,'disk',0)} Ephem={ephem} {pub}",
                 args.max_width))
 
     if images:
-        print(f"\nImages ({len(images)}):")
+        out.append(f"\nImages ({len(images)}):")
 
         def min_flavor_for(img) -> str:
             need_ram = int(getattr(img, "min_ram", 0) or 0)
@@ -622,24 +767,18 @@ def main():
             min_ram = int(getattr(i, "min_ram", 0) or 0)
             min_disk = int(getattr(i, "min_disk", 0) or 0)
             minflv = min_flavor_for(i)
-            print(wrap_bullet_line(
+            out.append(wrap_bullet_line(
                 f"  ▸ {name:<22} {status}  "
                 f"disk/container={disk_fmt}/{cont_fmt}  size={size}MB  vis={vis}  "
                 f"min:{min_ram}/{min_disk}  min-flavor:{minflv}",
                 args.max_width))
 
     if keypairs:
-        print(f"\nKeypairs ({len(keypairs)}):")
+        out.append(f"\nKeypairs ({len(keypairs)}):")
         parts = [f"{k.name} ({getattr(k, 'type', getattr(k, 'key_type', '-') )})" for k in sort_by_name(keypairs)]
-        print("  ▸ " + "   ▸ ".join(parts))
-
-    # Build caches for ports/FIPs/volumes -> servers
-    ports_by_server: Dict[str, List] = defaultdict(list)
-    for p in project_ports:
-        sid = getattr(p, "device_id", None)
-        if sid:
-            ports_by_server[sid].append(p)
+        out.append("  ▸ " + "   ▸ ".join(parts))
 
+    # Build caches for FIPs/volumes -> servers (ports_by_server is built with the routers)
     fip_by_port: Dict[str, List] = defaultdict(list)
     for f in project_fips:
         pid = getattr(f, "port_id", None)
@@ -647,7 +786,7 @@ def main():
             fip_by_port[pid].append(f)
 
     try:
-        volumes = list(conn.block_storage.volumes(details=True))
+        volumes = fetched["volumes"].result()
     except Exception:
         volumes = []
 
@@ -658,67 +797,67 @@ def main():
             if sid:
                 vols_by_server[sid].append(v)
 
-    print(f"\nInstances ({used_instances}/{limit_str(max_instances)}):")
+    # Resolve each attached port's security group names once, up front
+    port_sg_names: Dict[str, Tuple[str, ...]] = {
+        p.id: tuple(sg_name_by_id.get(g, g) for g in getattr(p, "security_group_ids", []) or [])
+        for ports in ports_by_server.values() for p in ports
+    }
+
+    out.append(f"\nInstances ({used_instances}/{limit_str(max_instances)}):")
     for s in sort_by_name(live_servers):
-        name = getattr(s, "name", s.id)
-        status = pal.colorize_status((getattr(s, "status", None) or "").upper() or "-")
-        sdict = {}
+        # One to_dict() per server; reading the plain dict is much cheaper than
+        # repeated getattr() through the SDK resource descriptors.
         try:
-            sdict = s.to_dict()
+            sd = s.to_dict()
         except Exception:
-            pass
-        vm_state = sdict.get("OS-EXT-STS:vm_state", getattr(s, "vm_state", None)) or "-"
-        pstate = getattr(s, "power_state", None)
+            sd = {k: getattr(s, k, None) for k in SERVER_FIELDS}
+        name = sd.get("name", s.id)
+        status = pal.colorize_status((sd.get("status") or "").upper() or "-")
+        vm_state = sd.get("vm_state") or "-"
+        pstate = sd.get("power_state")
         pstate_name = POWER_STATE_MAP.get(pstate, str(pstate) if pstate is not None else "-")
-        host = sdict.get("OS-EXT-SRV-ATTR:host", getattr(s, "host", None)) or "-"
-
-        img_name = "-"
-        try:
-            if isinstance(s.image, dict):
-                iid = s.image.get("id")
-                img_name = image_name_by_id.get(iid, iid or "-")
-            elif getattr(s, "image", None):
-                iid = getattr(s.image, "id", None)
-                img_name = image_name_by_id.get(iid, iid or "-")
-            else:
-                img_name = "volume-boot"
-        except Exception:
-            img_name = "volume-boot" if not getattr(s, "image", None) else "-"
-
+        host = sd.get("compute_host") or "-"
+
+        image = sd.get("image")
+        if isinstance(image, dict):
+            iid = image.get("id")
+            img_name = image_name_by_id.get(iid, iid or "-")
+        elif image:
+            iid = getattr(image, "id", None)
+            img_name = image_name_by_id.get(iid, iid or "-")
+        else:
+            img_name = "volume-boot"
+
+        flavor = sd.get("flavor")
         flv_name = "-"
         try:
-            fid = s.flavor.get("id") if isinstance(s.flavor, dict) else getattr(s.flavor, "id", None)
-            fobj = resolve_flavor(fid)
+            fid = flavor.get("id") if isinstance(flavor, dict) else getattr(flavor, "id", None)
+            fobj = flavor_by_id.get(fid)
             if fobj:
                 flv_name = getattr(fobj, "name", "-")
             else:
-                flv_name = s.flavor.get("original_name") if isinstance(s.flavor, dict) else "-"
+                flv_name = (flavor.get("original_name") if isinstance(flavor, dict) else None) or "-"
         except Exception:
             pass
 
-        keyname = getattr(s, "key_name", None) or "-"
+        keyname = sd.get("key_name") or "-"
 
-        print(wrap_bullet_line(
+        out.append(wrap_bullet_line(
             f"  ▸ {name:<12} [{status}({vm_state})] power={pstate_name} host={host} image={img_name} flavor={flv_name} key={keyname}",
             args.max_width
         ))
 
+        server_ports = ports_by_server.get(s.id, [])
+        sg_names = set().union(*(port_sg_names[p.id] for p in server_ports))
         port_bits: List[str] = []
-        sg_names: set = set()
-        for p in ports_by_server.get(s.id, []):
-            for sgid in getattr(p, "security_group_ids", []) or []:
-                sg_names.add(sg_name_by_id.get(sgid, sgid))
+        for p in server_ports:
+            fiptext = ""
+            for fx in fip_by_port.get(getattr(p, "id", None), []):
+                fiptext = f" (fip:{getattr(fx, 'floating_ip_address', '-')})"
+                break
             for f in getattr(p, "fixed_ips", []) or []:
-                sid = f.get("subnet_id")
-                ipaddr = f.get("ip_address")
-                sub = subnets_by_id.get(sid)
-                net = networks_by_id.get(getattr(sub, "network_id", None)) if sub else None
-                netname = getattr(net, "name", "-"); subname = getattr(sub, "name", "-")
-                fiptext = ""
-                for fx in fip_by_port.get(getattr(p, "id", None), []):
-                    fiptext = f" (fip:{getattr(fx, 'floating_ip_address', '-')})"
-                    break
-                port_bits.append(f"{netname}/{subname} {ipaddr}{fiptext}")
+                netname, subname = subnet_names_by_id.get(f.get("subnet_id"), ("-", "-"))
+                port_bits.append(f"{netname}/{subname} {f.get('ip_address')}{fiptext}")
 
         vol_bits: List[str] = []
         for v in vols_by_server.get(s.id, []):
@@ -726,18 +865,18 @@ def main():
             vsize = getattr(v, "size", 0)
             vol_bits.append(f"{vname}:{vsize}GB")
 
-        print(wrap_bullet_line(
-            "      ports:[" + ("; ".join(port_bits) if port_bits else "-") + "] • "
-            "vols:[" + ("; ".join(vol_bits) if vol_bits else "-") + "] • "
-            "sgs:[" + (", ".join(sorted(sg_names)) if sg_names else "-") + "]",
+        out.append(wrap_bullet_line(
+            f"      ports:[{'; '.join(port_bits) or '-'}] • "
+            f"vols:[{'; '.join(vol_bits) or '-'}] • "
+            f"sgs:[{', '.join(sorted(sg_names)) or '-'}]",
             args.max_width, indent=6
         ))
 
     # ---------------------------- Block Storage -----------------------------
-    print()
+    out.append("")
     c_vols_lim = c_snaps_lim = c_baks_lim = c_gib_lim = None
     try:
-        qset = conn.block_storage.get_quota_set(project_id)
+        qset = fetched["volume_quota"].result()
         c_vols_lim = getattr(qset, "volumes", None)
         c_snaps_lim = getattr(qset, "snapshots", None)
         c_baks_lim = getattr(qset, "backups", None)
@@ -746,11 +885,11 @@ def main():
         pass
 
     try:
-        snapshots = list(conn.block_storage.snapshots(details=True))
+        snapshots = fetched["snapshots"].result()
     except Exception:
         snapshots = []
     try:
-        backups = list(conn.block_storage.backups(details=True))
+        backups = fetched["backups"].result()
         backups_supported = True
     except Exception:
         backups = []
@@ -766,7 +905,7 @@ def main():
     baks_used = len(backups) if backups_supported else 0
     gib_used = sum(int(getattr(v, "size", 0) or 0) for v in volumes)
 
-    print(
+    out.append(
         f"{pal.BOLD}CINDER — Block Storage{pal.RESET}  "
         f"(vols {vols_used}/{limit_str(c_vols_lim)} • "
         f"snaps {snaps_used}/{limit_str(c_snaps_lim)} • "
@@ -775,6 +914,9 @@ def main():
     )
 
     server_name_by_id = {s.id: getattr(s, "name", s.id) for s in live_servers}
+    # Count snapshots/backups per volume in one pass each instead of rescanning per volume
+    snap_count = Counter(getattr(s, "volume_id", None) for s in snapshots)
+    bak_count = Counter(getattr(b, "volume_id", None) for b in backups)
     for v in sort_by_name(volumes):
         vname = getattr(v, "name", v.id)
         vtype = getattr(v, "volume_type", "-")
@@ -783,14 +925,16 @@ def main():
         backend = parse_backend_from_host(getattr(v, "host", None) or getattr(v, "os-vol-host-attr:host", None))
         atts = [server_name_by_id.get(a.get("server_id") or a.get("serverId"), "-") for a in getattr(v, "attachments", []) or []]
         attached_to = "[" + ("; ".join(atts) if atts else "") + "]" if atts else "-"
-        snaps_n = len([s for s in snapshots if getattr(s, "volume_id", None) == v.id])
-        baks_n  = len([b for b in backups if getattr(b, "volume_id", None) == v.id]) if backups_supported else "n/a"
-        print(wrap_bullet_line(
+        snaps_n = snap_count[v.id]
+        baks_n  = bak_count[v.id] if backups_supported else "n/a"
+        out.append(wrap_bullet_line(
             f"  ▸ {vname:<14} type={vtype} size={vsize}GB  {vstatus:<9} "
             f"attached:{attached_to:<18} backend={backend:<12} snaps={snaps_n} backups={baks_n}",
             args.max_width))
 
-    print()
+    out.append("")
+
+    sys.stdout.write("\n".join(out) + "\n")
 
 if __name__ == "__main__":
     main()
@@ -4,6 +4,7 @@ List OpenStack Neutron ports for the current project with rich, diagnostic colum
 
 Auth: uses environment variables (OS_AUTH_URL, OS_USERNAME, OS_PASSWORD, OS_PROJECT_NAME/ID, etc.)
 Requires: pip install openstacksdk
+Optional: pip install orjson (faster --json)
 
 Examples:
     python list_ports.py
@@ -19,32 +20,43 @@ import json
 import os
 import sys
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from functools import lru_cache
 
 try:
     import openstack
+    from openstack.exceptions import InvalidResourceQuery
 except ImportError:
     print("ERROR: openstacksdk is not installed. Try: pip install openstacksdk", file=sys.stderr)
     sys.exit(2)
 
+try:
+    import orjson  # Optional: faster --json serialization
+except ImportError:
+    orjson = None
 
+
+@lru_cache(maxsize=4096)
 def parse_isotime(s: str):
+    # Cached: ports created together share timestamps
     if not s:
         return None
     try:
         # Handle trailing Z
         if s.endswith("Z"):
-            return datetime.fromisoformat(s.replace("Z", "+00:00"))
+            return datetime.fromisoformat(s[:-1]).replace(tzinfo=timezone.utc)
         return datetime.fromisoformat(s)
     except Exception:
         return None
 
 
-def human_age(ts: str):
+def human_age(ts: str, now=None):
     dt = parse_isotime(ts)
     if not dt:
         return ""
-    now = datetime.now(timezone.utc)
+    if now is None:
+        now = datetime.now(timezone.utc)
     delta = now - dt
     total = int(delta.total_seconds())
     days, rem = divmod(total, 86400)
@@ -57,19 +69,106 @@ def human_age(ts: str):
     return f"{minutes}m"
 
 
-def get_binding_attr(port, key: str):
+BINDING_KEYS = ("binding:host_id", "binding:vif_type", "binding:vnic_type")
+
+
+def get_binding_attrs(port, keys=BINDING_KEYS):
     """
     Safely retrieve binding attributes that may appear as 'binding:host_id' or 'binding_host_id'.
+    The port is serialized with to_dict() at most once, and only if an attribute is missing.
+    """
+    vals = []
+    d = None
+    for key in keys:
+        alt = key.replace(":", "_")
+        val = getattr(port, alt, None)
+        if val is None:
+            if d is None:
+                try:
+                    d = port.to_dict(computed=False)
+                except Exception:
+                    d = {}
+            val = d.get(key, d.get(alt))
+        vals.append(val)
+    return vals
+
+
+def list_fields(list_call, fields, **query):
+    """
+    List a collection asking the server to return only `fields` (Neutron/Octavia
+    `fields=` projection). SDK versions that reject the parameter fail before any
+    request is sent, and get the full objects instead; server-side errors are
+    raised to the caller without a retry.
     """
-    alt = key.replace(":", "_")
-    val = getattr(port, alt, None)
-    if val is not None:
-        return val
     try:
-        d = port.to_dict(computed=False)
-        return d.get(key, d.get(alt))
-    except Exception:
-        return None
+        return list(list_call(fields=list(fields), **query))
+    except (InvalidResourceQuery, TypeError):
+        return list(list_call(**query))
+
+
+# Resource types the resolver indexes; fixed, so the caches can be plain dicts
+RESOURCE_TYPES = ("network", "subnet", "router", "security_group", "qos_policy",
+                  "server", "loadbalancer", "trunk")
+
+
+def tune_http_pool(conn, pool_connections: int = 16, pool_maxsize: int = 32):
+    """
+    Size the SDK session's keep-alive pool for the concurrent list/GET calls below,
+    so parallel requests reuse connections instead of opening (and TLS-handshaking)
+    new ones once the default pool of 10 is exhausted.
+    The replacement is keystoneauth's TCPKeepAliveAdapter, like the one it
+    replaces, so TCP keep-alive/TCP_NODELAY and any TLS settings are kept.
+    """
+    try:
+        from urllib3.util.retry import Retry
+        try:
+            from keystoneauth1.session import TCPKeepAliveAdapter as Adapter
+        except ImportError:
+            from requests.adapters import HTTPAdapter as Adapter
+    except ImportError:
+        return  # These ship with openstacksdk; keep the session defaults otherwise
+    session = conn.session.session
+    kwargs = {}
+    current = session.adapters.get("https://")
+    for opt in ("tls_ciphers", "tls_min_version"):  # Newer keystoneauth only
+        if hasattr(current, opt):
+            kwargs[opt] = getattr(current, opt)
+    adapter = Adapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(total=2, backoff_factor=0.2),
+        **kwargs,
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+
+# Output column -> resolver collections it needs ("fip" is the floating IP list).
+# Columns not listed here are read straight off the port.
+COLUMN_SOURCES = {
+    "ips": ("subnet", "network"),
+    "fips": ("fip", "network", "router"),
+    "secgroups": ("security_group",),
+    "bound_to": ("server", "router", "loadbalancer"),
+    "network": ("network",),
+    "qos_policy": ("qos_policy",),
+    "trunk": ("trunk",),
+}
+
+
+# device_owner -> resolver type of the device; "compute:<az>" matches on its prefix
+OWNER_TYPE = {
+    "compute": "server",
+    "network:router_interface": "router",
+    "network:router_interface_distributed": "router",
+    "network:router_ha_interface": "router",
+    "network:ha_router_replicated_interface": "router",
+    "network:router_gateway": "router",
+    "network:router_centralized_snat": "router",
+    "Octavia": "loadbalancer",
+    "neutron:LOADBALANCER": "loadbalancer",
+    "neutron:LOADBALANCERV2": "loadbalancer",
+}
 
 
 class NameResolver:
@@ -77,32 +176,67 @@ class NameResolver:
     Caches resources and returns a name only if it is present and unambiguous;
     otherwise returns the UUID.
     """
-    def __init__(self, conn, project_id: str):
+    def __init__(self, conn, project_id: str, needed=None):
+        """
+        `needed` is the set of collections to load (see COLUMN_SOURCES); the list
+        calls for everything else are skipped. None loads everything.
+        """
         self.conn = conn
         self.project_id = project_id
 
         # Primary caches
-        self._id = defaultdict(dict)        # type -> {id: obj}
-        self._name_to_ids = defaultdict(lambda: defaultdict(set))  # type -> {name: {ids}}
-
-        # Load resources visible to this project
-        self._load("network", conn.network.networks())
-        self._load("subnet", conn.network.subnets())
-        self._load("router", conn.network.routers())
-        self._load("security_group", conn.network.security_groups(project_id=project_id))
+        self._id = {typ: {} for typ in RESOURCE_TYPES}           # type -> {id: obj}
+        self._name_to_ids = {typ: {} for typ in RESOURCE_TYPES}  # type -> {name: {ids}}
+        self._display = {typ: {} for typ in RESOURCE_TYPES}      # type -> {id: unique name, else id}; see _finalize()
+        self.networks_by_id = self._id["network"]
+        self.subnets_by_id = self._id["subnet"]
+
+        # Load resources visible to this project. The list calls are independent,
+        # so fetch them concurrently; indexing stays on this thread (no locking).
+        # Servers are scoped to current project by default.
+        jobs = {
+            # Only ids, names and the relations used by build_rows are requested
+            "network": lambda: list_fields(conn.network.networks, ("id", "name")),
+            "subnet": lambda: list_fields(conn.network.subnets, ("id", "name", "network_id")),
+            "router": lambda: list_fields(conn.network.routers, ("id", "name")),
+            "security_group": lambda: list_fields(conn.network.security_groups, ("id", "name"),
+                                                  project_id=project_id),
+            "qos_policy": lambda: list_fields(conn.network.qos_policies, ("id", "name")),
+            # Nova has no field projection, but its non-detail list is just id/name/links
+            "server": lambda: list(conn.compute.servers(details=False, all_projects=False)),
+            "loadbalancer": lambda: list_fields(conn.load_balancer.load_balancers, ("id", "name")),
+            "trunk": lambda: list_fields(conn.network.trunks, ("id", "name", "port_id", "sub_ports")),
+            # FIPs on this project's ports are the project's own; admins would otherwise get every FIP.
+            # (QoS policies stay unfiltered: ports often use policies shared from another project.)
+            "fip": lambda: list_fields(conn.network.ips, ("id", "port_id", "floating_ip_address",
+                                                          "floating_network_id", "router_id"),
+                                       project_id=project_id),
+        }
+        if needed is not None:
+            jobs = {typ: fn for typ, fn in jobs.items() if typ in needed}
+        with ThreadPoolExecutor(max_workers=max(len(jobs), 1)) as ex:
+            fetched = {typ: ex.submit(fn) for typ, fn in jobs.items()}
+
+        def result(typ):
+            # Skipped collections behave like empty ones
+            return fetched[typ].result() if typ in fetched else []
+
+        self._load("network", result("network"))
+        self._load("subnet", result("subnet"))
+        self._load("router", result("router"))
+        self._load("security_group", result("security_group"))
         self._have_qos = True
         try:
-            self._load("qos_policy", conn.network.qos_policies())
+            self._load("qos_policy", result("qos_policy"))
         except Exception:
             # QoS extension may be disabled; don't fail hard
             self._have_qos = False
-        # Servers are scoped to current project by default
-        self._load("server", conn.compute.servers(all_projects=False))
+        self._load("server", result("server"))
 
         # Optional (may not be present in all clouds)
         self._have_lb = True
         try:
-            self._load("loadbalancer", conn.load_balancer.load_balancers())
+            self._load("loadbalancer", result("loadbalancer"))
         except Exception:
             self._have_lb = False
 
@@ -112,7 +246,7 @@ class NameResolver:
         self.trunk_by_id = {}
         self.subport_to_trunk = {}
         try:
-            self.trunks = list(conn.network.trunks())
+            self.trunks = result("trunk")
             for t in self.trunks:
                 self._index_obj("trunk", t)
                 self.trunk_by_id[t.id] = t
@@ -129,13 +263,15 @@ class NameResolver:
         self.fips_by_port = defaultdict(list)
         try:
             # Neutron floating IPs
-            for ip in conn.network.ips():
+            for ip in result("fip"):
                 if getattr(ip, "port_id", None):
                     self.fips_by_port[ip.port_id].append(ip)
         except Exception:
             # Older clouds might use compute FIPs; not covered here
             pass
 
+        self._finalize()
+
     def _load(self, typ: str, iterable):
         for obj in iterable:
             self._index_obj(typ, obj)
@@ -147,167 +283,224 @@ class NameResolver:
         self._id[typ][oid] = obj
         name = getattr(obj, "name", None) or getattr(obj, "display_name", None)
         if name:
-            self._name_to_ids[typ][name].add(oid)
+            self._name_to_ids[typ].setdefault(name, set()).add(oid)
+
+    def _finalize(self):
+        """
+        Resolve every cached object's display value once all resources are indexed,
+        so lookups in the per-port loop are a single dict hit.
+        """
+        for typ, objs in self._id.items():
+            names = self._name_to_ids[typ]
+            display = self._display[typ]
+            for oid, obj in objs.items():
+                name = getattr(obj, "name", None) or getattr(obj, "display_name", None)
+                display[oid] = name if name and len(names[name]) == 1 else oid
+
+        # subnet id -> network display name, and the "subnet(network)" label used per fixed IP
+        self.net_name_for_subnet = {
+            sid: self.name_or_id("network", getattr(s, "network_id", ""))
+            for sid, s in self.subnets_by_id.items()
+        }
+        subnet_display = self._display["subnet"]
+        self.subnet_label = {
+            sid: f"{subnet_display[sid]}({net_name})" for sid, net_name in self.net_name_for_subnet.items()
+        }
 
     def try_name(self, typ: str, oid: str):
         if not oid:
             return None
-        obj = self._id[typ].get(oid)
-        if not obj:
-            return None
-        name = getattr(obj, "name", None) or getattr(obj, "display_name", None)
-        if not name:
-            return None
-        ids = self._name_to_ids[typ].get(name, set())
-        return name if len(ids) == 1 else None
+        nm = self._display[typ].get(oid)
+        return nm if nm != oid else None
 
     def name_or_id(self, typ: str, oid: str):
         if not oid:
             return ""
-        nm = self.try_name(typ, oid)
-        return nm if nm else oid
+        return self._display[typ].get(oid, oid)
+
+
+# Every column build_rows can produce
+ROW_COLUMNS = ("id", "name", "network", "ips", "fips", "status", "admin", "secgroups", "device_owner",
+               "bound_to", "host", "vif_type", "vnic_type", "mac", "qos_policy", "port_security",
+               "trunk", "dns", "tags", "age")
 
+# Binding columns -> port attribute (see get_binding_attrs)
+BINDING_COLUMNS = {"host": "binding:host_id", "vif_type": "binding:vif_type", "vnic_type": "binding:vnic_type"}
 
-def build_rows(conn, resolver: NameResolver, ports):
-    rows = []
+
+def build_rows(conn, resolver: NameResolver, ports, columns=None):
+    """
+    Yield one row dict per port, so ports can be consumed as they are paged in.
+    Only `columns` (default: all of ROW_COLUMNS) are computed and set on each row.
+    """
+    needed = set(ROW_COLUMNS if columns is None else columns)
+    binding_cols = tuple(c for c in BINDING_COLUMNS if c in needed)
+    binding_keys = tuple(BINDING_COLUMNS[c] for c in binding_cols)
+    # Bind hot lookups to locals once instead of attribute lookups per port
+    name_or_id = resolver.name_or_id
+    subnet_label = resolver.subnet_label
+    fips_by_port = resolver.fips_by_port
+    now = datetime.now(timezone.utc)  # One reference time for every row's age
+    # Status, owner and binding values come from a small vocabulary; interning
+    # makes every row share one copy of each instead of one per port.
+    intern = sys.intern
+    # Port body fields are declared on openstack.network.v2.port.Port and default
+    # to None, so they are read directly; only undeclared ones go through getattr.
     for p in ports:
-        # Fixed IPs: ip + subnet name (network)
-        fixed_ip_strs = []
-        for fip in getattr(p, "fixed_ips", []) or []:
-            ip = fip.get("ip_address", "")
-            subnet_id = fip.get("subnet_id")
-            subnet_name = resolver.name_or_id("subnet", subnet_id)
-            net_name = ""
-            subnet_obj = resolver._id["subnet"].get(subnet_id)
-            if subnet_obj:
-                net_name = resolver.name_or_id("network", getattr(subnet_obj, "network_id", ""))
-            fixed_ip_strs.append(f"ip_address='{ip}', subnet='{subnet_name}({net_name})'")
-        fixed_ips_fmt = "; ".join(fixed_ip_strs)
+        row = {}
+        if "id" in needed:
+            row["id"] = p.id
+        if "name" in needed:
+            row["name"] = p.name or ""
+
+        # Network name
+        if "network" in needed:
+            row["network"] = name_or_id("network", p.network_id)
+
+        # Fixed IPs: ip + subnet name (network); unknown subnets show their raw id
+        if "ips" in needed:
+            row["ips"] = "; ".join(
+                f"ip_address='{fip.get('ip_address', '')}', "
+                f"subnet='{subnet_label.get(fip.get('subnet_id')) or (fip.get('subnet_id') or '') + '()'}'"
+                for fip in p.fixed_ips or ()
+            )
 
         # Floating IPs attached to this port
-        fip_strs = []
-        for f in resolver.fips_by_port.get(p.id, []):
-            fip = getattr(f, "floating_ip_address", "")
-            ext_net_name = resolver.name_or_id("network", getattr(f, "floating_network_id", ""))
-            router_name = resolver.name_or_id("router", getattr(f, "router_id", "")) if getattr(f, "router_id", None) else ""
-            base = f"fip='{fip}', external_net='{ext_net_name}'"
-            if router_name:
-                base += f", router='{router_name}'"
-            fip_strs.append(base)
-        fips_fmt = "; ".join(fip_strs)
+        if "fips" in needed:
+            row["fips"] = "; ".join(
+                f"fip='{getattr(f, 'floating_ip_address', '')}', "
+                f"external_net='{name_or_id('network', getattr(f, 'floating_network_id', ''))}'"
+                + (f", router='{name_or_id('router', f.router_id)}'" if getattr(f, "router_id", None) else "")
+                for f in fips_by_port.get(p.id, [])
+            )
+
+        if "status" in needed:
+            row["status"] = intern(p.status) if p.status else ""
+        if "admin" in needed:
+            admin_up = p.is_admin_state_up
+            row["admin"] = "" if admin_up is None else ("UP" if admin_up else "DOWN")
 
         # Security groups: names if unambiguous
-        sg_names = []
-        for sgid in getattr(p, "security_group_ids", None) or getattr(p, "security_groups", []) or []:
-            # openstacksdk exposes either .security_group_ids (preferred) or .security_groups
-            sg_names.append(resolver.name_or_id("security_group", sgid))
-        secgroups_fmt = ",".join(sg_names)
+        if "secgroups" in needed:
+            row["secgroups"] = ",".join(name_or_id("security_group", sgid) for sgid in p.security_group_ids or ())
+
+        if "device_owner" in needed:
+            row["device_owner"] = intern(p.device_owner) if p.device_owner else ""
 
         # Device binding target name
-        owner = getattr(p, "device_owner", "") or ""
-        device_id = getattr(p, "device_id", "") or ""
-        bound_to = ""
-        if device_id:
-            if owner.startswith("compute"):
-                bound_to = resolver.name_or_id("server", device_id)
-            elif owner.startswith("network:router"):
-                bound_to = resolver.name_or_id("router", device_id)
-            elif "LOADBALANCER" in owner.upper() or "OCTAVIA" in owner.lower():
-                bound_to = resolver.name_or_id("loadbalancer", device_id) if resolver._have_lb else device_id
-            else:
-                # Best-effort fallback
-                for typ in ("server", "router", "loadbalancer"):
-                    nm = resolver.try_name(typ, device_id)
-                    if nm:
-                        bound_to = nm
-                        break
-                bound_to = bound_to or device_id
+        if "bound_to" in needed:
+            owner = p.device_owner or ""
+            device_id = p.device_id or ""
+            bound_to = ""
+            if device_id:
+                typ = OWNER_TYPE.get(owner) or OWNER_TYPE.get(owner.split(":", 1)[0])
+                if typ == "loadbalancer" and not resolver._have_lb:
+                    bound_to = device_id
+                elif typ:
+                    bound_to = name_or_id(typ, device_id)
+                else:
+                    # Best-effort fallback
+                    for typ in ("server", "router", "loadbalancer"):
+                        nm = resolver.try_name(typ, device_id)
+                        if nm:
+                            bound_to = nm
+                            break
+                    bound_to = bound_to or device_id
+            row["bound_to"] = bound_to
 
         # Binding diagnostics
-        host = get_binding_attr(p, "binding:host_id") or ""
-        vif_type = get_binding_attr(p, "binding:vif_type") or ""
-        vnic_type = get_binding_attr(p, "binding:vnic_type") or ""
+        if binding_cols:
+            row.update(zip(binding_cols, (intern(v) if v else "" for v in get_binding_attrs(p, binding_keys))))
 
-        # Trunk diagnostics
-        trunk_role = ""
-        if p.id in resolver.trunk_by_parent_port:
-            t = resolver.trunk_by_parent_port[p.id]
-            tname = resolver.name_or_id("trunk", t.id)
-            nsubs = len(getattr(t, "sub_ports", []) or [])
-            trunk_role = f"TRUNK-PARENT {tname} (subports={nsubs})"
-        elif p.id in resolver.subport_to_trunk:
-            t = resolver.subport_to_trunk[p.id]["trunk"]
-            sp = resolver.subport_to_trunk[p.id]["sp"]
-            tname = resolver.name_or_id("trunk", t.id)
-            segtype = sp.get("segmentation_type", "")
-            segid = sp.get("segmentation_id", "")
-            trunk_role = f"TRUNK-SUBPORT of {tname} [{segtype}:{segid}]"
+        if "mac" in needed:
+            row["mac"] = p.mac_address or ""
 
         # QoS policy name (if any)
-        qos_policy = resolver.name_or_id("qos_policy", getattr(p, "qos_policy_id", "")) if getattr(p, "qos_policy_id", None) else ""
+        if "qos_policy" in needed:
+            qos_policy_id = getattr(p, "qos_policy_id", None)
+            row["qos_policy"] = name_or_id("qos_policy", qos_policy_id) if qos_policy_id else ""
 
-        # Network name
-        network_name = resolver.name_or_id("network", getattr(p, "network_id", ""))
+        if "port_security" in needed:
+            port_security = p.is_port_security_enabled
+            row["port_security"] = "" if port_security is None else ("on" if port_security else "off")
 
-        # Allowed address pairs
-        aaps = getattr(p, "allowed_address_pairs", []) or []
-        aap_strs = [f"{a.get('ip_address','')}({a.get('mac_address','')})" for a in aaps]
-        aap_fmt = ",".join(aap_strs)
+        # Trunk diagnostics
+        if "trunk" in needed:
+            trunk_role = ""
+            if p.id in resolver.trunk_by_parent_port:
+                t = resolver.trunk_by_parent_port[p.id]
+                tname = name_or_id("trunk", t.id)
+                nsubs = len(getattr(t, "sub_ports", []) or [])
+                trunk_role = f"TRUNK-PARENT {tname} (subports={nsubs})"
+            elif p.id in resolver.subport_to_trunk:
+                t = resolver.subport_to_trunk[p.id]["trunk"]
+                sp = resolver.subport_to_trunk[p.id]["sp"]
+                tname = name_or_id("trunk", t.id)
+                segtype = sp.get("segmentation_type", "")
+                segid = sp.get("segmentation_id", "")
+                trunk_role = f"TRUNK-SUBPORT of {tname} [{segtype}:{segid}]"
+            row["trunk"] = trunk_role
 
         # DNS name (and FQDN if present)
-        dns_name = getattr(p, "dns_name", "") or ""
-        fqdn = ""
-        for da in getattr(p, "dns_assignment", []) or []:
-            # dns_assignment is a list of dicts: {'hostname', 'fqdn', 'ip_address'}
-            if da.get("fqdn"):
-                fqdn = da["fqdn"]
-                break
-        dns_fmt = dns_name if dns_name else fqdn
-
-        admin_up = getattr(p, "is_admin_state_up", None)
-        if admin_up is None:
-            admin_up = getattr(p, "admin_state_up", None)
-        admin_up = "" if admin_up is None else ("UP" if admin_up else "DOWN")
-
-        row = {
-            "id": p.id,
-            "name": getattr(p, "name", "") or "",
-            "network": network_name,
-            "ips": fixed_ips_fmt,
-            "fips": fips_fmt,
-            "status": getattr(p, "status", "") or "",
-            "admin": admin_up,
-            "secgroups": secgroups_fmt,
-            "device_owner": owner,
-            "bound_to": bound_to,
-            "host": host,
-            "vif_type": vif_type,
-            "vnic_type": vnic_type,
-            "mac": getattr(p, "mac_address", "") or "",
-            "qos_policy": qos_policy,
-            "port_security": "" if getattr(p, "port_security_enabled", None) is None else ("on" if p.port_security_enabled else "off"),
-            "trunk": trunk_role,
-            "dns": dns_fmt,
-            "tags": ",".join(getattr(p, "tags", []) or []),
-            "age": human_age(getattr(p, "created_at", "")),
-        }
-        rows.append(row)
-    return rows
+        if "dns" in needed:
+            dns_fmt = p.dns_name or ""
+            if not dns_fmt:
+                for da in p.dns_assignment or ():
+                    # dns_assignment is a list of dicts: {'hostname', 'fqdn', 'ip_address'}
+                    if da.get("fqdn"):
+                        dns_fmt = da["fqdn"]
+                        break
+            row["dns"] = dns_fmt
 
+        if "tags" in needed:
+            row["tags"] = ",".join(p.tags or ())
+        if "age" in needed:
+            row["age"] = human_age(p.created_at, now)
+        yield row
 
-def print_table(rows, columns):
+
+def dumps_indent2(obj) -> str:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+def write_json(rows, columns, fh):
+    """
+    Stream rows as a JSON array, one element at a time. The output is laid out
+    like json.dumps(list_of_rows, indent=2, ensure_ascii=False), without building
+    the list first; orjson and the json fallback write the same bytes.
+    """
+    first = True
+    for r in rows:
+        fh.write("[\n  " if first else ",\n  ")
+        fh.write(dumps_indent2({c: r.get(c, "") for c in columns}).replace("\n", "\n  "))
+        first = False
+    fh.write("[]\n" if first else "\n]\n")
+
+
+def print_table(rows, columns, force_align: bool = False):
+    # Not a terminal (pipe/file): plain tab-separated lines, no width pass needed
+    if not force_align and not sys.stdout.isatty():
+        # Each line is written as its row is built, so rows are never all held at once
+        sys.stdout.write("\t".join(columns) + "\n")
+        sys.stdout.writelines("\t".join(str(r.get(c, "")) for c in columns) + "\n" for r in rows)
+        return
+
+    rows = list(rows)
     # Compute column widths
     widths = {c: len(c) for c in columns}
     for r in rows:
         for c in columns:
             widths[c] = max(widths[c], len(str(r.get(c, ""))))
-    # Print header
-    header = "  ".join(f"{c.upper():<{widths[c]}}" for c in columns)
-    sep = "  ".join("-" * widths[c] for c in columns)
-    print(header)
-    print(sep)
-    for r in rows:
-        print("  ".join(f"{str(r.get(c, '')):<{widths[c]}}" for c in columns))
+    # One format string for every line, instead of a format spec per cell
+    fmt = "  ".join(f"{{:<{widths[c]}}}" for c in columns)
+    lines = [
+        fmt.format(*(c.upper() for c in columns)),
+        "  ".join("-" * widths[c] for c in columns),
+    ]
+    lines.extend(fmt.format(*(str(r.get(c, "")) for c in columns)) for r in rows)
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main():
@@ -319,6 +512,8 @@ def main():
     parser.add_argument("--wide", action="store_true", help="Show more diagnostic columns.")
     parser.add_argument("--columns", default=None,
                         help="Comma-separated list of columns to show (overrides --wide).")
+    parser.add_argument("--align", action="store_true",
+                        help="Align table columns even when stdout is not a terminal (default: tab-separated).")
     parser.add_argument("--debug", action="store_true", help="Enable openstacksdk HTTP logging.")
     args = parser.parse_args()
 
@@ -327,6 +522,7 @@ def main():
 
     # Connect: prefer env vars; --cloud if provided points to clouds.yaml
     conn = openstack.connect(cloud=args.cloud)
+    tune_http_pool(conn)
 
     # Determine current project
     project_id = args.project_id
@@ -341,11 +537,8 @@ def main():
         print("ERROR: Could not determine current project_id. Set OS_PROJECT_ID or use --project-id.", file=sys.stderr)
         sys.exit(3)
 
-    # Fetch ports for the current project
-    ports = list(conn.network.ports(project_id=project_id))
-
-    resolver = NameResolver(conn, project_id)
-    rows = build_rows(conn, resolver, ports)
+    # Ports for the current project; not materialized, pages are fetched while rows are produced
+    ports = conn.network.ports(project_id=project_id)
 
     # Default column sets
     default_cols = ["id", "bound_to", "ips", "fips", "status", "secgroups", "device_owner"]
@@ -359,20 +552,26 @@ def main():
     else:
         columns = wide_cols if args.wide else default_cols
 
-    # Output
+    # Only load the collections the selected columns resolve names from
+    needed = {src for c in columns for src in COLUMN_SOURCES.get(c, ())}
+    resolver = NameResolver(conn, project_id, needed)
+    rows = build_rows(conn, resolver, ports, columns)
+
+    # Output: --json, --csv and unaligned tables stream rows; aligned tables need all rows for column widths
     if args.json:
         # Only include selected columns
-        out = [{c: r.get(c, "") for c in columns} for r in rows]
-        print(json.dumps(out, indent=2, sort_keys=False))
+        write_json(rows, columns, sys.stdout)
     elif args.csv:
+        n = 0
         with open(args.csv, "w", newline="") as f:
             writer = csv.DictWriter(f, fieldnames=columns)
             writer.writeheader()
             for r in rows:
                 writer.writerow({c: r.get(c, "") for c in columns})
-        print(f"Wrote {len(rows)} rows to {args.csv}")
+                n += 1
+        print(f"Wrote {n} rows to {args.csv}")
     else:
-        print_table(rows, columns)
+        print_table(rows, columns, force_align=args.align)
 
 
 if __name__ == "__main__":